@@ -1,29 +1,159 @@
 import json
 import heapq
-import networkx as nx
-import matplotlib.pyplot as plt
-from collections import defaultdict
+from array import array
+from functools import lru_cache
 from ipaddress import IPv4Network, IPv4Address
 import sys
 import math
 import os
 import glob
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import orjson as _json
+except ImportError:
+    _json = json
+
+# Upper bound on Dial bucket-queue size; larger cost ranges fall back to heapq.
+DIAL_MAX_BUCKETS = 1 << 16
+# Below this many routers, process start-up costs more than the SPF runs it would spread out.
+PARALLEL_MIN_ROUTERS = 256
+# Below this many routers, importing numba and compiling the kernel costs more than the SPF runs it would speed up.
+JIT_MIN_ROUTERS = 512
+
+_worker_topology = None
+np = None
+_dijkstra_csr = None
+_jit_loaded = False
+
+
+def _init_table_worker(topology):
+    global _worker_topology
+    _worker_topology = topology
+
+
+def _table_worker(router_name):
+    return router_name, _worker_topology.generate_routing_table(router_name)
+
+
+def _dijkstra_csr_kernel(indptr, indices, weights, source, n, is_target, remaining):
+    dist = np.full(n, np.inf)
+    dist[source] = 0.0
+    heap_d = np.empty(indices.shape[0] + 1, np.float64)
+    heap_v = np.empty(indices.shape[0] + 1, np.int32)
+    heap_d[0] = 0.0
+    heap_v[0] = source
+    size = 1
+    while size > 0 and remaining != 0:
+        d = heap_d[0]
+        u = heap_v[0]
+        size -= 1
+        if size > 0:
+            last_d = heap_d[size]
+            last_v = heap_v[size]
+            i = 0
+            while True:
+                c = 2 * i + 1
+                if c >= size:
+                    break
+                if c + 1 < size and heap_d[c + 1] < heap_d[c]:
+                    c += 1
+                if heap_d[c] >= last_d:
+                    break
+                heap_d[i] = heap_d[c]
+                heap_v[i] = heap_v[c]
+                i = c
+            heap_d[i] = last_d
+            heap_v[i] = last_v
+        if d > dist[u]:
+            continue
+        if is_target[u]:
+            remaining -= 1
+            if remaining == 0:
+                break
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            new_dist = d + weights[k]
+            if new_dist < dist[v]:
+                dist[v] = new_dist
+                i = size
+                size += 1
+                while i > 0:
+                    p = (i - 1) // 2
+                    if heap_d[p] <= new_dist:
+                        break
+                    heap_d[i] = heap_d[p]
+                    heap_v[i] = heap_v[p]
+                    i = p
+                heap_d[i] = new_dist
+                heap_v[i] = v
+    preds_indptr = np.zeros(n + 1, np.int32)
+    for v in range(n):
+        count = 0
+        if v != source and dist[v] < np.inf:
+            for k in range(indptr[v], indptr[v + 1]):
+                if dist[indices[k]] + weights[k] == dist[v]:
+                    count += 1
+        preds_indptr[v + 1] = preds_indptr[v] + count
+    preds_flat = np.empty(preds_indptr[n], np.int32)
+    for v in range(n):
+        j = preds_indptr[v]
+        if v != source and dist[v] < np.inf:
+            for k in range(indptr[v], indptr[v + 1]):
+                if dist[indices[k]] + weights[k] == dist[v]:
+                    preds_flat[j] = indices[k]
+                    j += 1
+    return dist, preds_flat, preds_indptr
+
+
+def _load_jit():
+    global np, _dijkstra_csr, _jit_loaded
+    if not _jit_loaded:
+        _jit_loaded = True
+        try:
+            import numpy
+            from numba import njit
+        except ImportError:
+            return None
+        np = numpy
+        _dijkstra_csr = njit(cache=True)(_dijkstra_csr_kernel)
+    return _dijkstra_csr
+
+
+@lru_cache(maxsize=None)
+def _ipaddr(address):
+    return IPv4Address(address)
+
+
+@lru_cache(maxsize=None)
+def _ipnet(network):
+    return IPv4Network(network)
 
 
 class OSPFRouter:
+    __slots__ = ('router_id', 'name', 'router_type', 'interfaces', 'areas', '_areas_sorted', '_primary_area', '_multi_area', '_neighbor_index', '_local_networks')
+
     def __init__(self, router_id, name):
         self.router_id = router_id
         self.name = name
         self.router_type = "internal"
         self.interfaces = {}
         self.areas = set()
+        self._areas_sorted = []
+        self._primary_area = 0
+        self._multi_area = False
+        self._neighbor_index = {}
+        self._local_networks = set()
 
 
 class OSPFInterface:
+    __slots__ = ('name', 'ip_address', 'network', 'cost', 'area', 'connected_router', 'neighbor_ip', '_network_str')
+
     def __init__(self, name, ip_address, network, cost, area):
         self.name = name
-        self.ip_address = IPv4Address(ip_address)
-        self.network = IPv4Network(network)
+        self.ip_address = _ipaddr(ip_address)
+        self.network = _ipnet(network)
+        self._network_str = sys.intern(str(self.network))
         self.cost = cost
         self.area = area
         self.connected_router = None
@@ -35,16 +165,31 @@ class OSPFTopology:
         self.routers = {}
         self.areas = {}
         self.topology_type = "unknown"
-        self.graph = nx.Graph()
+        self._graph = None
+        self._links = []
         self.config = {}
+        self._sssp_cache = {}
+        self._dest_nets = []
+        self._adj = {}
+        self._edge_weight = {}
+        self._idx = {}
+        self._names = []
+        self._indptr = array('i', [0])
+        self._indices = array('i')
+        self._weights = array('q')
+        self._bucket_count = 0
+        self._integral_weights = True
+        self._np_csr = None
+        self._node_colors = []
+        self._viz_cache = None
         self.load_configuration(config_file)
         self.detect_topology_type()
         self.build_topology()
 
     def load_configuration(self, config_file):
         try:
-            with open(config_file, 'r') as f:
-                self.config = json.load(f)
+            with open(config_file, 'rb') as f:
+                self.config = _json.loads(f.read())
         except FileNotFoundError:
             print(f"Error: File '{config_file}' not found")
             sys.exit(1)
@@ -52,13 +197,16 @@ class OSPFTopology:
             print(f"Error: Invalid JSON in '{config_file}'")
             sys.exit(1)
 
+        self._validate_configuration()
         self.areas = self.config.get('areas', {})
 
         for router_name, router_config in self.config['routers'].items():
+            router_name = sys.intern(router_name)
             router = OSPFRouter(router_config['router_id'], router_name)
             router.router_type = router_config.get('router_type', 'internal')
 
             for intf_name, intf_config in router_config['interfaces'].items():
+                intf_name = sys.intern(intf_name)
                 ip_address = self._get_interface_ip(intf_config)
                 network = intf_config.get('network', self._derive_network(ip_address))
                 cost = intf_config.get('cost', 1)
@@ -70,43 +218,70 @@ class OSPFTopology:
                 connected_to = intf_config.get('connected_to')
                 if connected_to:
                     if isinstance(connected_to, dict):
-                        interface.connected_router = connected_to.get('router')
+                        peer = connected_to.get('router')
+                        interface.connected_router = sys.intern(peer) if isinstance(peer, str) else peer
                         interface.neighbor_ip = connected_to.get('ip')
                     elif isinstance(connected_to, str):
-                        interface.connected_router = connected_to
+                        interface.connected_router = sys.intern(connected_to)
 
                 router.interfaces[intf_name] = interface
 
+            router._areas_sorted = sorted(router.areas)
+            router._primary_area = router._areas_sorted[0] if router._areas_sorted else 0
+            router._multi_area = len(router._areas_sorted) > 1
             self.routers[router_name] = router
 
         self._resolve_neighbor_ips()
 
+    def _validate_configuration(self):
+        routers = self.config.get('routers')
+        if not isinstance(routers, dict):
+            raise ValueError("Configuration must contain a 'routers' object")
+        for router_name, router_config in routers.items():
+            if not isinstance(router_config, dict):
+                raise ValueError(f"Router '{router_name}' must be an object")
+            missing = [key for key in ('router_id', 'interfaces') if key not in router_config]
+            if missing:
+                raise ValueError(f"Router '{router_name}' is missing required keys: {missing}")
+            interfaces = router_config['interfaces']
+            if not isinstance(interfaces, dict):
+                raise ValueError(f"Router '{router_name}' interfaces must be an object")
+            for intf_name, intf_config in interfaces.items():
+                if not isinstance(intf_config, dict):
+                    raise ValueError(f"Interface '{router_name}/{intf_name}' must be an object")
+                if not any(intf_config.get(key) for key in ('ip_address', 'ip', 'IP', 'address')):
+                    raise ValueError(f"Interface '{router_name}/{intf_name}' has no IP address. Expected one of: ['ip_address', 'ip', 'IP', 'address']")
+                cost = intf_config.get('cost', 1)
+                if isinstance(cost, bool) or not isinstance(cost, (int, float)) or not 1 <= cost <= 65535:
+                    raise ValueError(f"Interface '{router_name}/{intf_name}' cost must be a number from 1 to 65535, got {cost!r}")
+                connected_to = intf_config.get('connected_to')
+                if connected_to is not None and not isinstance(connected_to, (str, dict)):
+                    raise ValueError(f"Interface '{router_name}/{intf_name}' connected_to must be a router name or an object")
+
     def _get_interface_ip(self, intf_config):
-        ip_keys = ['ip_address', 'ip', 'IP', 'address']
-        for key in ip_keys:
-            if key in intf_config:
-                return intf_config[key]
-        raise KeyError(f"No IP address found. Available keys: {list(intf_config.keys())}. Expected keys: {ip_keys}")
+        return intf_config.get('ip_address') or intf_config.get('ip') or intf_config.get('IP') or intf_config.get('address')
 
     def _derive_network(self, ip_address):
-        ip = IPv4Address(ip_address)
-        if str(ip).startswith('192.168'):
-            return f"{str(ip).rsplit('.', 1)[0]}.0/24"
-        elif str(ip).startswith('10.'):
-            return f"{str(ip).split('.', 1)[0]}.0.0.0/8"
+        ip_int = int(IPv4Address(ip_address))
+        if ip_int >> 24 == 10:
+            prefix, mask = 8, 0xFF000000
         else:
-            return f"{str(ip).rsplit('.', 1)[0]}.0/24"
+            prefix, mask = 24, 0xFFFFFF00
+        net_int = ip_int & mask
+        return f"{net_int >> 24}.{(net_int >> 16) & 0xFF}.{(net_int >> 8) & 0xFF}.{net_int & 0xFF}/{prefix}"
 
     def _resolve_neighbor_ips(self):
+        peer_interfaces = {}
+        for router_name, router in self.routers.items():
+            for interface in router.interfaces.values():
+                if interface.connected_router:
+                    peer_interfaces.setdefault((router_name, interface.connected_router, interface._network_str), interface)
         for router_name, router in self.routers.items():
-            for intf_name, interface in router.interfaces.items():
+            for interface in router.interfaces.values():
                 if interface.connected_router and not interface.neighbor_ip:
-                    neighbor_router = self.routers.get(interface.connected_router)
-                    if neighbor_router:
-                        for neighbor_intf in neighbor_router.interfaces.values():
-                            if neighbor_intf.connected_router == router_name and neighbor_intf.network == interface.network:
-                                interface.neighbor_ip = str(neighbor_intf.ip_address)
-                                break
+                    neighbor_intf = peer_interfaces.get((interface.connected_router, router_name, interface._network_str))
+                    if neighbor_intf:
+                        interface.neighbor_ip = str(neighbor_intf.ip_address)
 
     def detect_topology_type(self):
         metadata = self.config.get('topology_metadata', {})
@@ -115,7 +290,7 @@ class OSPFTopology:
             return
         total_areas = len(self.areas)
         has_area_0 = '0' in self.areas
-        abr_count = sum(1 for router in self.routers.values() if len(router.areas) > 1)
+        abr_count = sum(1 for router in self.routers.values() if router._multi_area)
         if total_areas <= 1:
             if len(self.routers) == 4:
                 self.topology_type = "single_area_ring"
@@ -127,39 +302,218 @@ class OSPFTopology:
             self.topology_type = "single_area"
         print(f"Auto-detected topology: {self.topology_type}")
 
+    @property
+    def graph(self):
+        if self._graph is None:
+            import networkx as nx
+            graph = nx.Graph()
+            for router_name, router in self.routers.items():
+                graph.add_node(router_name, router_id=router.router_id, router_type=router.router_type, areas=list(router.areas))
+            for a, b, attrs in self._links:
+                graph.add_edge(a, b, **attrs)
+            self._graph = graph
+        return self._graph
+
     def build_topology(self):
-        for router_name, router in self.routers.items():
-            self.graph.add_node(router_name, router_id=router.router_id, router_type=router.router_type, areas=list(router.areas))
+        self._adj = {}
+        self._edge_weight = {}
+        self._links = []
+        self._graph = None
+        for router_name in self.routers:
+            self._adj[router_name] = []
         processed_links = set()
         for router_name, router in self.routers.items():
             for intf_name, intf in router.interfaces.items():
                 if intf.connected_router:
-                    link = tuple(sorted([router_name, intf.connected_router]))
-                    link_key = f"{link}_{intf.area}"
+                    peer = intf.connected_router
+                    link_key = (router_name, peer, intf.area) if router_name <= peer else (peer, router_name, intf.area)
                     if link_key not in processed_links:
-                        self.graph.add_edge(router_name, intf.connected_router, weight=intf.cost, area=intf.area, network=str(intf.network))
+                        self._links.append((router_name, intf.connected_router, {'weight': intf.cost, 'area': intf.area, 'network': intf._network_str}))
+                        self._add_adjacency(router_name, intf.connected_router, intf.cost)
                         processed_links.add(link_key)
-
-    def dijkstra_multi_path(self, source):
-        distances = {node: float('inf') for node in self.graph.nodes()}
-        distances[source] = 0
-        paths = defaultdict(list)
-        paths[source] = [[source]]
-        pq = [(0, source)]
-        while pq:
-            dist, node = heapq.heappop(pq)
-            if dist > distances[node]:
+            router._neighbor_index = {intf.connected_router: (intf_name, intf.neighbor_ip) for intf_name, intf in reversed(list(router.interfaces.items())) if intf.connected_router}
+            router._local_networks = {intf._network_str for intf in router.interfaces.values()}
+        self._dest_nets = []
+        seen_networks = set()
+        for router_name, router in self.routers.items():
+            for intf in router.interfaces.values():
+                if intf._network_str not in seen_networks:
+                    seen_networks.add(intf._network_str)
+                    self._dest_nets.append((intf._network_str, router_name, intf.cost, intf.area))
+        self._node_colors = []
+        for router_name in self._adj:
+            router = self.routers.get(router_name)
+            router_type = router.router_type if router else "internal"
+            if router_type == "abr":
+                self._node_colors.append("orange")
+            elif router_type == "asbr":
+                self._node_colors.append("red")
+            else:
+                self._node_colors.append("lightblue")
+        self._build_csr()
+        self._sssp_cache.clear()
+
+    def _add_adjacency(self, a, b, cost):
+        if (a, b) not in self._edge_weight:
+            self._adj.setdefault(a, []).append(b)
+            if a != b:
+                self._adj.setdefault(b, []).append(a)
+        self._edge_weight[(a, b)] = self._edge_weight[(b, a)] = cost
+
+    def _build_csr(self):
+        self._names = list(self._adj)
+        self._idx = {name: i for i, name in enumerate(self._names)}
+        edge_weight = self._edge_weight
+        adj = [[(self._idx[nbr], edge_weight[(name, nbr)]) for nbr in self._adj[name]] for name in self._names]
+        weights = [w for edges in adj for _, w in edges]
+        self._indptr = array('i', [0])
+        for edges in adj:
+            self._indptr.append(self._indptr[-1] + len(edges))
+        self._indices = array('i', [v for edges in adj for v, _ in edges])
+        integral = all(isinstance(w, int) for w in weights)
+        self._integral_weights = integral
+        self._weights = array('q' if integral else 'd', weights)
+        self._np_csr = None
+        if integral and (not weights or min(weights) >= 0):
+            self._bucket_count = max(weights, default=0) * max(len(self._names) - 1, 0) + 1
+        else:
+            self._bucket_count = 0
+
+    def dijkstra_multi_path(self, source, targets=None):
+        """Return (distances, preds) for SPF from source.
+
+        When targets is given the search stops once every target is settled,
+        and only routers no farther than the farthest target are returned;
+        with positive link costs those entries are all final.
+        """
+        key = (source, None if targets is None else frozenset(targets))
+        if key in self._sssp_cache:
+            return self._sssp_cache[key]
+        if targets is not None:
+            targets = {self._idx[name] for name in targets}
+        src = self._idx[source]
+        if len(self._names) >= JIT_MIN_ROUTERS and _load_jit() is not None:
+            dist, pred = self._jit_spf(src, targets)
+        elif self._bucket_count and self._bucket_count <= DIAL_MAX_BUCKETS:
+            dist, pred = self._dial_spf(src, targets)
+        else:
+            dist, pred = self._heap_spf(src, targets)
+        names = self._names
+        settled = range(len(names))
+        if targets is not None:
+            bound = max((dist[t] for t in targets), default=0)
+            settled = [i for i in settled if dist[i] <= bound]
+        distances = {names[i]: dist[i] for i in settled}
+        preds = {names[i]: [names[p] for p in pred[i]] for i in settled if pred[i] is not None}
+        self._sssp_cache[key] = (distances, preds)
+        return distances, preds
+
+    def _jit_spf(self, src, targets=None):
+        dijkstra_csr = _load_jit()
+        if self._np_csr is None:
+            self._np_csr = (np.array(self._indptr, dtype=np.int32), np.array(self._indices, dtype=np.int32), np.array(self._weights, dtype=np.float64))
+        indptr, indices, weights = self._np_csr
+        n = len(self._names)
+        is_target = np.zeros(n, np.bool_)
+        if targets is None:
+            remaining = -1
+        else:
+            is_target[list(targets)] = True
+            remaining = len(targets)
+        dist, preds_flat, preds_indptr = dijkstra_csr(indptr, indices, weights, src, n, is_target, remaining)
+        dist = [int(d) if self._integral_weights and d != math.inf else float(d) for d in dist.tolist()]
+        preds_flat, preds_indptr = preds_flat.tolist(), preds_indptr.tolist()
+        pred = [preds_flat[preds_indptr[v]:preds_indptr[v + 1]] or None for v in range(n)]
+        return dist, pred
+
+    def _heap_spf(self, src, targets=None):
+        indptr, indices, weights = self._indptr, self._indices, self._weights
+        push, pop = heapq.heappush, heapq.heappop
+        n = len(self._names)
+        dist = [float('inf')] * n
+        pred = [None] * n
+        dist[src] = 0
+        pq = [(0, src)]
+        remaining = -1 if targets is None else len(targets)
+        while pq and remaining:
+            d, u = pop(pq)
+            if d > dist[u]:
+                continue
+            if targets is not None and u in targets:
+                remaining -= 1
+                if not remaining:
+                    break
+            for k in range(indptr[u], indptr[u + 1]):
+                v = indices[k]
+                new_dist = d + weights[k]
+                old_dist = dist[v]
+                if new_dist < old_dist:
+                    dist[v] = new_dist
+                    pred[v] = [u]
+                    push(pq, (new_dist, v))
+                elif new_dist == old_dist:
+                    pred[v].append(u)
+        return dist, pred
+
+    def _dial_spf(self, src, targets=None):
+        indptr, indices, weights = self._indptr, self._indices, self._weights
+        n = len(self._names)
+        dist = [float('inf')] * n
+        pred = [None] * n
+        dist[src] = 0
+        buckets = {0: [src]}
+        cur = last = 0
+        remaining = -1 if targets is None else len(targets)
+        while cur <= last and remaining:
+            bucket = buckets.get(cur)
+            while bucket:
+                u = bucket.pop()
+                if cur > dist[u]:
+                    continue
+                if targets is not None and u in targets:
+                    remaining -= 1
+                    if not remaining:
+                        break
+                for k in range(indptr[u], indptr[u + 1]):
+                    v = indices[k]
+                    new_dist = cur + weights[k]
+                    old_dist = dist[v]
+                    if new_dist < old_dist:
+                        dist[v] = new_dist
+                        pred[v] = [u]
+                        if new_dist in buckets:
+                            buckets[new_dist].append(v)
+                        else:
+                            buckets[new_dist] = [v]
+                        if new_dist > last:
+                            last = new_dist
+                    elif new_dist == old_dist:
+                        pred[v].append(u)
+            buckets.pop(cur, None)
+            cur += 1
+        return dist, pred
+
+    def next_hops(self, source, dest, pred, first_hops=None):
+        if first_hops is None:
+            first_hops = {}
+        stack = [dest]
+        while stack:
+            node = stack[-1]
+            if node in first_hops:
+                stack.pop()
                 continue
-            for neighbor in self.graph.neighbors(node):
-                edge_weight = self.graph[node][neighbor]['weight']
-                new_dist = dist + edge_weight
-                if new_dist < distances[neighbor]:
-                    distances[neighbor] = new_dist
-                    paths[neighbor] = [path + [neighbor] for path in paths[node]]
-                    heapq.heappush(pq, (new_dist, neighbor))
-                elif new_dist == distances[neighbor]:
-                    paths[neighbor].extend([path + [neighbor] for path in paths[node]])
-        return distances, dict(paths)
+            pending = [p for p in pred.get(node, ()) if p != source and p not in first_hops]
+            if pending:
+                stack.extend(pending)
+                continue
+            hops = []
+            for p in pred.get(node, ()):
+                for hop in ([node] if p == source else first_hops[p]):
+                    if hop not in hops:
+                        hops.append(hop)
+            first_hops[node] = hops
+            stack.pop()
+        return first_hops[dest]
 
     def determine_route_type(self, source_router, dest_router, dest_area):
         if self.topology_type in ["single_area", "single_area_ring"]:
@@ -172,82 +526,75 @@ class OSPFTopology:
 
     def generate_routing_table(self, router_name):
         router = self.routers[router_name]
-        distances, all_paths = self.dijkstra_multi_path(router_name)
+        local_networks = router._local_networks
+        targets = {owner for network_str, owner, _, _ in self._dest_nets if owner != router_name and network_str not in local_networks}
+        distances, pred = self.dijkstra_multi_path(router_name, targets)
+        first_hops = {}
         ospf_routes = []
-        processed_networks = set()
-        for dest_router_name, dest_router in self.routers.items():
-            if dest_router_name != router_name:
-                for intf_name, interface in dest_router.interfaces.items():
-                    network_str = str(interface.network)
-                    if network_str in processed_networks:
-                        continue
-                    is_directly_connected = False
-                    for src_intf in router.interfaces.values():
-                        if str(src_intf.network) == network_str:
-                            is_directly_connected = True
-                            break
-                    if is_directly_connected:
-                        continue
-                    processed_networks.add(network_str)
-                    if dest_router_name in all_paths:
-                        paths_to_dest = all_paths[dest_router_name]
-                        next_hop_paths = defaultdict(list)
-                        for path in paths_to_dest:
-                            if len(path) > 1:
-                                next_hop = path[1]
-                                next_hop_paths[next_hop].append(path)
-                        for next_hop_router, paths_list in next_hop_paths.items():
-                            path_cost = distances[dest_router_name]
-                            total_cost = path_cost + interface.cost
-                            route_type = self.determine_route_type(router, dest_router, interface.area)
-                            next_hop_ip = self.find_next_hop_ip(router_name, next_hop_router)
-                            outbound_interface = self.find_outbound_interface(router_name, next_hop_router)
-                            if next_hop_ip and outbound_interface:
-                                route_entry = {'network': network_str, 'next_hop': next_hop_ip, 'cost': int(total_cost), 'via_interface': outbound_interface, 'route_type': route_type}
-                                ospf_routes.append(route_entry)
+        routers = self.routers
+        next_hops = self.next_hops
+        neighbor_info = self._neighbor_info
+        for network_str, dest_router_name, intf_cost, area in self._dest_nets:
+            if dest_router_name == router_name or network_str in local_networks:
+                continue
+            if dest_router_name in pred:
+                total_cost = distances[dest_router_name] + intf_cost
+                route_type = self.determine_route_type(router, routers[dest_router_name], area)
+                for next_hop_router in next_hops(router_name, dest_router_name, pred, first_hops):
+                    next_hop_ip, outbound_interface = neighbor_info(router_name, next_hop_router)
+                    if next_hop_ip and outbound_interface:
+                        route_entry = {'network': network_str, 'next_hop': next_hop_ip, 'cost': int(total_cost), 'via_interface': outbound_interface, 'route_type': route_type}
+                        ospf_routes.append(route_entry)
         return ospf_routes
 
-    def find_next_hop_ip(self, source_router, next_hop_router):
-        source = self.routers[source_router]
-        for intf_name, interface in source.interfaces.items():
-            if interface.connected_router == next_hop_router:
-                return interface.neighbor_ip
-        return None
-
-    def find_outbound_interface(self, source_router, next_hop_router):
-        source = self.routers[source_router]
-        for intf_name, interface in source.interfaces.items():
-            if interface.connected_router == next_hop_router:
-                return intf_name
-        return None
-
-    def print_routing_table(self, router_name):
-        ospf_routes = self.generate_routing_table(router_name)
+    def _neighbor_info(self, source_router, next_hop_router):
+        neighbor = self.routers[source_router]._neighbor_index.get(next_hop_router)
+        if neighbor is None:
+            return None, None
+        intf_name, neighbor_ip = neighbor
+        return neighbor_ip, intf_name
+
+    def compute_all_tables(self, max_workers=None):
+        if len(self.routers) < PARALLEL_MIN_ROUTERS or (max_workers or os.cpu_count() or 1) <= 1:
+            return {router_name: self.generate_routing_table(router_name) for router_name in self.routers}
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_table_worker, initargs=(self,)) as pool:
+            return dict(pool.map(_table_worker, self.routers, chunksize=max(1, len(self.routers) // 32)))
+
+    def print_routing_table(self, router_name, ospf_routes=None):
+        if ospf_routes is None:
+            ospf_routes = self.generate_routing_table(router_name)
         router = self.routers[router_name]
         print(f"\n=== Routing Table for {router_name} (Router ID: {router.router_id}) ===")
         print(f"Topology: {self.topology_type.replace('_', ' ').title()}")
-        if len(router.areas) > 1:
-            print(f"Router Type: {router.router_type.upper()} (Areas: {sorted(list(router.areas))})")
+        if router._multi_area:
+            print(f"Router Type: {router.router_type.upper()} (Areas: {router._areas_sorted})")
         else:
-            print(f"Router Type: {router.router_type.upper()} (Area: {list(router.areas)[0] if router.areas else 0})")
+            print(f"Router Type: {router.router_type.upper()} (Area: {router._primary_area})")
         print()
         if not ospf_routes:
             print("No routes found.")
             return
-        routes_by_network = defaultdict(list)
+        best_routes = {}
         for route in ospf_routes:
-            routes_by_network[route['network']].append(route)
-        for network, routes in routes_by_network.items():
-            routes.sort(key=lambda r: (r['cost'], r['via_interface']))
+            best = best_routes.get(route['network'])
+            if best is None or route['cost'] < best[0]['cost']:
+                best_routes[route['network']] = [route]
+            elif route['cost'] == best[0]['cost']:
+                best.append(route)
+        for network, routes in best_routes.items():
+            if len(routes) > 1:
+                routes.sort(key=lambda r: r['via_interface'])
             first_route = routes[0]
             route_type = first_route.get('route_type', 'O')
             print(f"{route_type:4} {network} [110/{first_route['cost']}] via {first_route['next_hop']}, {first_route['via_interface']}")
             for route in routes[1:]:
-                if route['cost'] == first_route['cost']:
-                    print(f"                [110/{route['cost']}] via {route['next_hop']}, {route['via_interface']}")
+                print(f"                [110/{route['cost']}] via {route['next_hop']}, {route['via_interface']}")
 
-    def visualize_topology(self):
-        plt.figure(figsize=(14, 10))
+    def _visualization_layout(self):
+        import networkx as nx
+        key = (self.topology_type, tuple(sorted(self.graph.nodes())), tuple(sorted(self.graph.edges(data='weight'))))
+        if self._viz_cache is not None and self._viz_cache[0] == key:
+            return self._viz_cache[1]
         n = len(self.routers)
         if self.topology_type == "single_area_ring" or "ring" in self.topology_type.lower():
             pos = {}
@@ -258,15 +605,26 @@ class OSPFTopology:
             pos = nx.spring_layout(self.graph, k=3, iterations=50)
         else:
             pos = nx.spring_layout(self.graph, k=4, iterations=100)
-        colors = []
-        for router_name in self.graph.nodes():
-            router = self.routers[router_name]
-            if router.router_type == "abr":
-                colors.append("orange")
-            elif router.router_type == "asbr":
-                colors.append("red")
+        labels = {}
+        for router_name, router in self.routers.items():
+            if router._multi_area:
+                labels[router_name] = f"{router_name}\n({router.router_id})\nAreas: {router._areas_sorted}"
             else:
-                colors.append("lightblue")
+                labels[router_name] = f"{router_name}\n({router.router_id})\nArea: {router._primary_area}"
+        edge_labels = {}
+        for edge in self.graph.edges():
+            edge_labels[edge] = f"Cost: {self._edge_weight[edge]}"
+        layout = (pos, labels, edge_labels)
+        self._viz_cache = (key, layout)
+        return layout
+
+    def visualize_topology(self):
+        import networkx as nx
+        import matplotlib.pyplot as plt
+        plt.figure("OSPF Topology", figsize=(14, 10))
+        plt.clf()
+        pos, labels, edge_labels = self._visualization_layout()
+        colors = self._node_colors
         nx.draw_networkx_nodes(self.graph, pos, node_color=colors, node_size=2500, alpha=0.8)
         if self.topology_type == "multi_area":
             area_colors = {0: "red", 1: "blue", 2: "green", 3: "purple", 4: "brown"}
@@ -276,16 +634,7 @@ class OSPFTopology:
                 nx.draw_networkx_edges(self.graph, pos, edgelist=[edge], edge_color=color, width=3)
         else:
             nx.draw_networkx_edges(self.graph, pos, edge_color="red", width=3)
-        labels = {}
-        for router_name, router in self.routers.items():
-            if len(router.areas) > 1:
-                labels[router_name] = f"{router_name}\n({router.router_id})\nAreas: {sorted(router.areas)}"
-            else:
-                labels[router_name] = f"{router_name}\n({router.router_id})\nArea: {list(router.areas)[0] if router.areas else 0}"
         nx.draw_networkx_labels(self.graph, pos, labels, font_size=8, font_weight="bold")
-        edge_labels = {}
-        for edge in self.graph.edges():
-            edge_labels[edge] = f"Cost: {self.graph.get_edge_data(*edge)['weight']}"
         nx.draw_networkx_edge_labels(self.graph, pos, edge_labels, font_size=8)
         legend_elements = []
         if self.topology_type == "multi_area":
@@ -390,12 +739,13 @@ def main():
             print("\nRouter Details:")
             for router_name, router in ospf_network.routers.items():
                 interface_count = len([intf for intf in router.interfaces.values() if intf.connected_router])
-                areas_str = ', '.join(map(str, sorted(router.areas))) if router.areas else '0'
+                areas_str = ', '.join(map(str, router._areas_sorted)) if router._areas_sorted else '0'
                 router_type_str = router.router_type.upper()
                 print(f"   - {router_name} ({router_type_str}): Areas [{areas_str}], {interface_count} connections")
             
+            routing_tables = ospf_network.compute_all_tables()
             for router_name in ospf_network.routers.keys():
-                ospf_network.print_routing_table(router_name)
+                ospf_network.print_routing_table(router_name, routing_tables[router_name])
             
             show_viz = input("\nShow network visualization? (y/n): ").lower().strip()
             if show_viz in ['y', 'yes', '']:
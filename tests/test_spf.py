@@ -0,0 +1,67 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ospf
+
+
+def write_topology(links):
+    """Write a single-area topology JSON for (router, router, cost) links and return its path."""
+    routers = {}
+    for i, (a, b, cost) in enumerate(links, 1):
+        for j, (name, peer) in enumerate(((a, b), (b, a)), 1):
+            if name not in routers:
+                routers[name] = {"router_id": ".".join([str(len(routers) + 1)] * 4), "interfaces": {}}
+            router = routers[name]
+            router["interfaces"][f"Gi0/{len(router['interfaces'])}"] = {
+                "ip_address": f"10.{i}.0.{j}",
+                "network": f"10.{i}.0.0/24",
+                "cost": cost,
+                "connected_to": peer,
+            }
+    for k, router in enumerate(routers.values(), 1):
+        router["interfaces"][f"Gi0/{len(router['interfaces'])}"] = {"ip_address": f"192.168.{k}.1", "network": f"192.168.{k}.0/24", "cost": 1}
+    fd, path = tempfile.mkstemp(suffix=".json")
+    with os.fdopen(fd, "w") as f:
+        json.dump({"routers": routers}, f)
+    return path
+
+
+def load_topology(links):
+    """Write and load a topology for (router, router, cost) links."""
+    path = write_topology(links)
+    try:
+        return ospf.OSPFTopology(path)
+    finally:
+        os.remove(path)
+
+
+class PartialSPFTests(unittest.TestCase):
+    def test_targeted_run_returns_only_settled_routers(self):
+        topology = load_topology([("R1", "R2", 1), ("R2", "R3", 1), ("R3", "R4", 1), ("R1", "R5", 5)])
+        distances, preds = topology.dijkstra_multi_path("R1", {"R2"})
+        self.assertEqual(set(distances), {"R1", "R2"})
+        full_distances, full_preds = topology.dijkstra_multi_path("R1")
+        for name, dist in distances.items():
+            self.assertEqual(dist, full_distances[name])
+            self.assertEqual(preds.get(name), full_preds.get(name))
+
+
+class ConfigurationValidationTests(unittest.TestCase):
+    def test_rejects_out_of_range_cost(self):
+        for cost in (0, -5, 65536):
+            with self.subTest(cost=cost):
+                path = write_topology([("R1", "R2", cost)])
+                try:
+                    with self.assertRaisesRegex(ValueError, "cost must be a number from 1 to 65535"):
+                        ospf.OSPFTopology(path)
+                finally:
+                    os.remove(path)
+
+
+if __name__ == "__main__":
+    unittest.main()